@@ -4,6 +4,7 @@
 # SECURITY REMINDER: Add credentials.json and token.json to .gitignore
 # These files contain sensitive authentication information and should never be committed to version control
 
+import json
 import os
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -11,9 +12,44 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# orjson is optional - when present it speeds up decoding of large Gmail API
+# responses (a format='raw' message is a multi-MB JSON body)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define the API scope for full email access
 SCOPES = ['https://mail.google.com/']
 
+
+def install_fast_json():
+    """
+    Swap googleapiclient's response JSON decoder for orjson when available.
+
+    Response parsing goes through the json module bound in
+    googleapiclient.model; orjson decodes large responses ~2-3x faster than
+    the stdlib parser. Serialization stays on the stdlib module because
+    googleapiclient expects str from dumps while orjson.dumps returns bytes.
+    No-op if orjson is not installed or the client internals have changed.
+    """
+    if orjson is None:
+        return
+
+    try:
+        import googleapiclient.model
+
+        class _FastJson:
+            loads = staticmethod(orjson.loads)
+            dumps = staticmethod(json.dumps)
+
+        googleapiclient.model.json = _FastJson
+    except Exception as e:
+        print(f"Note: could not enable orjson response decoding: {e}")
+
+
+install_fast_json()
+
 def get_gmail_service():
     """
     Authenticates and returns a Gmail API service object.
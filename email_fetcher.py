@@ -1,7 +1,17 @@
+import asyncio
 import base64
 from googleapiclient.errors import HttpError
 from auth import get_gmail_service
 
+# aiohttp is optional - only needed for the concurrent async fetcher
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Gmail REST endpoint used by the async fetcher
+GMAIL_API_BASE = 'https://gmail.googleapis.com/gmail/v1/users/me'
+
 def search_emails(service, query):
     """
     Search for emails using Gmail API server-side filtering.
@@ -73,6 +83,182 @@ def get_raw_email(service, message_id):
         print(f'An error occurred fetching message {message_id}: {error}')
         return None
 
+def get_raw_emails_batch(service, message_ids):
+    """
+    Fetch the raw content of many email messages in batched HTTP requests.
+
+    Fetching messages one at a time turns a scan of N emails into N
+    sequential HTTPS round trips. The Gmail API supports batching, so this
+    packs up to 100 messages.get calls into a single HTTP request.
+
+    Args:
+        service: Authenticated Gmail API service object
+        message_ids: Iterable of Gmail message IDs to fetch
+
+    Returns:
+        Dict mapping message ID to raw email bytes. Messages that failed to
+        fetch are omitted from the result.
+    """
+    if not service:
+        print("Error: Gmail service object is None")
+        return {}
+
+    message_ids = list(message_ids)
+    results = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            print(f'An error occurred fetching message {request_id}: {exception}')
+            return
+        raw_data = response.get('raw')
+        if not raw_data:
+            print(f"No raw data found for message ID: {request_id}")
+            return
+        results[request_id] = base64.urlsafe_b64decode(raw_data)
+
+    # The Gmail batch endpoint accepts at most 100 calls per request
+    batch_size = 100
+
+    try:
+        for start in range(0, len(message_ids), batch_size):
+            batch = service.new_batch_http_request(callback=_collect)
+            for message_id in message_ids[start:start + batch_size]:
+                batch.add(
+                    service.users().messages().get(
+                        userId='me',
+                        id=message_id,
+                        format='raw'
+                    ),
+                    request_id=message_id
+                )
+            batch.execute()
+
+        return results
+
+    except HttpError as error:
+        print(f'An error occurred during batched email fetch: {error}')
+        return results
+
+
+def get_metadata_batch(service, message_ids, metadata_headers=('Subject', 'From', 'Date')):
+    """
+    Fetch lightweight metadata for many messages in batched requests.
+
+    A metadata response carries only selected headers and the snippet - a
+    few hundred bytes versus the full raw MIME - which makes it suitable for
+    triaging which messages are worth downloading in full.
+
+    Args:
+        service: Authenticated Gmail API service object
+        message_ids: Iterable of Gmail message IDs to fetch
+        metadata_headers: Header names to include in the response
+
+    Returns:
+        Dict mapping message ID to {'headers': {name: value}, 'snippet': str}.
+        Messages that failed to fetch are omitted from the result.
+    """
+    if not service:
+        print("Error: Gmail service object is None")
+        return {}
+
+    message_ids = list(message_ids)
+    results = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            print(f'An error occurred fetching metadata for {request_id}: {exception}')
+            return
+        headers = {
+            header['name']: header['value']
+            for header in response.get('payload', {}).get('headers', [])
+        }
+        results[request_id] = {
+            'headers': headers,
+            'snippet': response.get('snippet', '')
+        }
+
+    # The Gmail batch endpoint accepts at most 100 calls per request
+    batch_size = 100
+
+    try:
+        for start in range(0, len(message_ids), batch_size):
+            batch = service.new_batch_http_request(callback=_collect)
+            for message_id in message_ids[start:start + batch_size]:
+                batch.add(
+                    service.users().messages().get(
+                        userId='me',
+                        id=message_id,
+                        format='metadata',
+                        metadataHeaders=list(metadata_headers)
+                    ),
+                    request_id=message_id
+                )
+            batch.execute()
+
+        return results
+
+    except HttpError as error:
+        print(f'An error occurred during batched metadata fetch: {error}')
+        return results
+
+
+def get_raw_emails_async(credentials, message_ids, max_concurrency=20):
+    """
+    Fetch raw email contents concurrently with asyncio + aiohttp.
+
+    An alternative to get_raw_emails_batch: instead of packing calls into
+    Gmail batch requests, this issues messages.get requests against the REST
+    endpoint directly and lets them run in parallel, so wall time approaches
+    the slowest single request rather than the sum of all of them. Each
+    request fails independently, which makes per-message error isolation
+    easier than with a batch request.
+
+    Args:
+        credentials: Authorized google.oauth2 credentials (supplies the
+            OAuth bearer token)
+        message_ids: Iterable of Gmail message IDs to fetch
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        Dict mapping message ID to raw email bytes. Messages that failed to
+        fetch are omitted from the result.
+    """
+    if aiohttp is None:
+        print("Error: aiohttp is not installed (pip install aiohttp)")
+        return {}
+
+    if not credentials or not credentials.token:
+        print("Error: No valid credentials for async email fetch")
+        return {}
+
+    message_ids = list(message_ids)
+    headers = {'Authorization': f'Bearer {credentials.token}'}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_raw(session, message_id):
+        url = f'{GMAIL_API_BASE}/messages/{message_id}?format=raw'
+        async with semaphore:
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                data = await response.json()
+        return message_id, base64.urlsafe_b64decode(data['raw'])
+
+    async def fetch_all():
+        async with aiohttp.ClientSession() as session:
+            tasks = [fetch_raw(session, mid) for mid in message_ids]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = {}
+    for outcome in asyncio.run(fetch_all()):
+        if isinstance(outcome, Exception):
+            print(f'An error occurred during async email fetch: {outcome}')
+            continue
+        message_id, raw_email_bytes = outcome
+        results[message_id] = raw_email_bytes
+
+    return results
+
+
 if __name__ == '__main__':
     # Test the email fetching functionality
     print("Testing Email Ingestion & Filtering Module...")
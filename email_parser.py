@@ -6,8 +6,57 @@ Handles complex email formats, multipart messages, and various character encodin
 """
 
 import email
+import email.policy
+import html
+import re
 from email.message import Message
 from email.header import decode_header, make_header
+from email.parser import BytesParser
+
+# One parser instance for all messages; email.message_from_bytes constructs
+# a fresh BytesParser per call
+_PARSER = BytesParser(policy=email.policy.default)
+
+# selectolax is optional - it is a fast C-backed HTML parser used to extract
+# visible text from HTML-only emails. Without it a regex fallback is used.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+# Cap on text extracted from HTML bodies; marketing emails can carry
+# megabytes of markup with very little visible text
+_MAX_HTML_TEXT_CHARS = 8000
+
+# Regex fallback for HTML-to-text when selectolax is unavailable
+_SCRIPT_STYLE = re.compile(r'<(script|style)\b.*?</\1>', re.IGNORECASE | re.DOTALL)
+_HTML_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def html_to_text(html_content):
+    """
+    Extract visible text from an HTML email body.
+
+    Args:
+        html_content: Decoded HTML markup string
+
+    Returns:
+        str: Visible text with tags removed and whitespace collapsed
+    """
+    if not html_content:
+        return ""
+
+    if _SelectolaxParser is not None:
+        tree = _SelectolaxParser(html_content)
+        node = tree.body or tree.root
+        text = node.text(separator=' ') if node is not None else ""
+    else:
+        # Stdlib fallback: drop script/style blocks, strip tags, unescape
+        without_blocks = _SCRIPT_STYLE.sub(' ', html_content)
+        text = html.unescape(_HTML_TAG.sub(' ', without_blocks))
+
+    return _WHITESPACE.sub(' ', text).strip()[:_MAX_HTML_TEXT_CHARS]
 
 
 def decode_email_header(header_string):
@@ -22,7 +71,14 @@ def decode_email_header(header_string):
     """
     if not header_string:
         return ""
-    
+
+    # Fast path: a header with no RFC 2047 encoded word ("=?charset?...?=")
+    # decodes to itself, so skip building the parts list and Header object.
+    # This covers plain-ASCII headers and strings already decoded by the
+    # parsing policy - the common case for both.
+    if isinstance(header_string, str) and '=?' not in header_string:
+        return header_string
+
     try:
         # Get a list of decoded parts using decode_header()
         decoded_parts = decode_header(header_string)
@@ -52,20 +108,42 @@ def get_email_body(email_message):
         print("Error: Invalid email message object")
         return ""
     
+    # Fast path: EmailMessage (policy.default) can locate the best body part
+    # directly, without walking every MIME part in Python. HTML-only emails
+    # (common for marketing/notification mail) fall back to text extraction
+    # rather than being dropped.
+    if hasattr(email_message, 'get_body'):
+        try:
+            body_part = email_message.get_body(preferencelist=('plain', 'html'))
+            if body_part is not None:
+                content = body_part.get_content()
+                if body_part.get_content_type() == 'text/html':
+                    return html_to_text(content)
+                return content.strip()
+        except Exception as e:
+            print(f"Warning: Could not extract body via get_body: {e}")
+
     # Check if the message is multipart
     if email_message.is_multipart():
+        # Remember the first text/html part in case no text/plain part exists
+        html_body = None
+
         # Iterate through all parts of the email using walk()
         for part in email_message.walk():
-            # Check if this part is plain text and not an attachment
+            # Skip multipart containers - only leaf parts carry a payload
+            if part.get_content_maintype() == 'multipart':
+                continue
+
+            # Check if this part is plain text or HTML and not an attachment
             content_type = part.get_content_type()
             content_disposition = str(part.get('Content-Disposition', ''))
-            
-            if (content_type == 'text/plain' and 
+
+            if (content_type in ('text/plain', 'text/html') and
                 'attachment' not in content_disposition):
-                
+
                 # Get character set with utf-8 as fallback
                 charset = part.get_content_charset() or 'utf-8'
-                
+
                 try:
                     # Decode the payload
                     payload = part.get_payload(decode=True)
@@ -74,14 +152,24 @@ def get_email_body(email_message):
                         if isinstance(payload, bytes):
                             # Decode using the determined character set with error handling
                             body = payload.decode(charset, errors='replace')
-                            return body.strip()
                         elif isinstance(payload, str):
-                            # Already decoded, return as is
-                            return payload.strip()
+                            # Already decoded, use as is
+                            body = payload
+                        else:
+                            continue
+
+                        if content_type == 'text/plain':
+                            return body.strip()
+                        if html_body is None:
+                            html_body = body
                 except Exception as e:
                     print(f"Warning: Could not decode email part: {e}")
                     continue
-    
+
+        # No text/plain part found - extract visible text from HTML instead
+        if html_body is not None:
+            return html_to_text(html_body)
+
     else:
         # Handle non-multipart messages
         try:
@@ -95,10 +183,17 @@ def get_email_body(email_message):
                 if isinstance(payload, bytes):
                     # Decode using the same charset logic
                     body = payload.decode(charset, errors='replace')
-                    return body.strip()
                 elif isinstance(payload, str):
-                    # Already decoded, return as is
-                    return payload.strip()
+                    # Already decoded, use as is
+                    body = payload
+                else:
+                    body = None
+
+                if body is not None:
+                    # HTML-only messages get their visible text extracted
+                    if email_message.get_content_type() == 'text/html':
+                        return html_to_text(body)
+                    return body.strip()
         except Exception as e:
             print(f"Warning: Could not decode email body: {e}")
     
@@ -120,8 +215,9 @@ def parse_raw_email(raw_email_bytes):
         return {'subject': '', 'from': '', 'to': '', 'body': ''}
     
     try:
-        # Create the email.message.Message object from raw bytes
-        email_message = email.message_from_bytes(raw_email_bytes)
+        # Parse with the modern policy so get_email_body can use the
+        # get_body() fast path instead of walking every MIME part
+        email_message = _PARSER.parsebytes(raw_email_bytes)
         
         # Extract headers
         raw_subject = email_message.get('Subject', '')
@@ -11,102 +11,245 @@ Required spaCy model:
 python -m spacy download en_core_web_sm
 """
 
+import functools
+import hashlib
+import os
+import re
+
+# dateparser compiles enough regexes to overflow the re module's default
+# 512-entry pattern cache, after which every call recompiles its patterns
+# from scratch - a measured multi-x slowdown on the date-parsing path.
+# _MAXCACHE is private, hence the guard.
+try:
+    re._MAXCACHE = max(re._MAXCACHE, 4096)
+except AttributeError:
+    pass
+
 import spacy
-import dateparser
-from datetime import datetime
+from dateparser.date import DateDataParser
+from datetime import date, datetime
 from typing import List, Dict, Optional, Any
 
 
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the spaCy model exactly once per process.
+
+    Loading en_core_web_sm reads the full pipeline from disk, which is far too
+    expensive to repeat for every email in a scan. The lru_cache makes this a
+    module-level singleton: the first call pays the load cost, every later
+    call returns the same pipeline instance.
+
+    The tagger, lemmatizer, and attribute_ruler are excluded: the module only
+    reads DATE/TIME entity labels and the dependency head of each entity, so
+    those components would be pure per-document overhead. The parser stays
+    because find_actionable_events uses ent.root.head for event context.
+
+    Setting REMINDER_USE_GPU=1 asks spaCy to place the pipeline on the GPU
+    when one is available, which pays off on large inbox scans.
+
+    Raises:
+        OSError: If the spaCy model is not installed
+    """
+    if os.environ.get('REMINDER_USE_GPU'):
+        if not spacy.prefer_gpu():
+            print("Warning: REMINDER_USE_GPU is set but no GPU is available - using CPU")
+
+    return spacy.load(
+        'en_core_web_sm',
+        exclude=['tagger', 'lemmatizer', 'attribute_ruler']
+    )
+
+
+# Cheap prefilter run before the neural pipeline: if an email contains none
+# of these date-like tokens, spaCy cannot find a DATE/TIME entity worth
+# keeping, so the NER pass can be skipped entirely. Hints are deliberately
+# broad (digits, month/weekday names, relative-date words) to avoid false
+# negatives.
+_DATE_HINT = re.compile(
+    r'\b(?:'
+    r'\d{1,2}[/.-]\d{1,2}'                                   # 12/31, 3-14
+    r'|\d{1,2}(?:st|nd|rd|th)?'                              # 5, 28th
+    r'|today|tonight|tomorrow|yesterday'
+    r'|next|this|coming'
+    r'|mon(?:day)?|tue(?:s(?:day)?)?|wed(?:nesday)?|thu(?:rs(?:day)?)?'
+    r'|fri(?:day)?|sat(?:urday)?|sun(?:day)?'
+    r'|jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?'
+    r'|jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?'
+    r'|nov(?:ember)?|dec(?:ember)?'
+    r'|week|month|noon|midnight|[ap]\.?m\.?'
+    r')\b',
+    re.IGNORECASE
+)
+
+
+# Hard cap on text fed to the neural pipeline. NER cost grows linearly with
+# tokens, and long emails are dominated by quoted replies and signatures
+# rather than new actionable content.
+_MAX_TEXT_CHARS = 8000
+
+# Quoted-reply lines (">" prefixed) repeat content that was already analyzed
+# when the original email arrived
+_QUOTED_LINE = re.compile(r'^\s*>.*$', re.MULTILINE)
+
+# Conventional signature delimiter: everything after a "-- " line is boilerplate
+_SIGNATURE_SPLIT = re.compile(r'^--\s*$', re.MULTILINE)
+
+
+def _condense_text(text: str) -> str:
+    """
+    Trim an email text to its informative core before NER.
+
+    Strips quoted-reply lines and the signature block, then truncates to
+    _MAX_TEXT_CHARS so a single long email cannot dominate scan time.
+
+    Args:
+        text: Combined subject/body text
+
+    Returns:
+        Condensed text suitable for the spaCy pipeline
+    """
+    # Drop the signature block first so its quoted disclaimer lines go too
+    text = _SIGNATURE_SPLIT.split(text, maxsplit=1)[0]
+
+    # Remove quoted-reply lines
+    text = _QUOTED_LINE.sub('', text)
+
+    return text[:_MAX_TEXT_CHARS]
+
+
+def has_date_hint(text: str) -> bool:
+    """
+    Cheap check for date-like tokens, usable as a triage filter.
+
+    Lets callers skip expensive work (raw email downloads, NER) for text
+    that cannot contain an actionable date. Uses the same broad hint regex
+    as find_actionable_events, so it never filters out anything the full
+    pipeline would have kept.
+
+    Args:
+        text: Any text to test (e.g. an email subject or snippet)
+
+    Returns:
+        True if the text contains at least one date-like token
+    """
+    return bool(text) and _DATE_HINT.search(text) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_date_parser() -> DateDataParser:
+    """
+    Build the dateparser parser exactly once per process.
+
+    dateparser.parse constructs a fresh DateDataParser and runs language
+    detection on every call; the entities here always come from English NER,
+    so a single English-only parser skips that work entirely.
+    """
+    return DateDataParser(
+        languages=['en'],
+        settings={'PREFER_DATES_FROM': 'future'}
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_date_string_for_day(entity_text: str, today_ordinal: int) -> Optional[datetime]:
+    """Memoized dateparser call; today_ordinal only serves as a cache key."""
+    date_data = _get_date_parser().get_date_data(entity_text)
+    return date_data.date_obj
+
+
+def _parse_date_string(entity_text: str) -> Optional[datetime]:
+    """
+    Parse a date-like entity string, memoizing repeated strings.
+
+    Phrases like "tomorrow" and "next Friday" recur across emails in the
+    same scan, so caching saves most dateparser calls. Relative phrases
+    resolve against the current day, so the cache key includes today's
+    ordinal: in the long-running scheduler a "tomorrow" cached on Monday
+    would otherwise still mean Tuesday when parsed on Thursday.
+
+    Args:
+        entity_text: Raw text of a DATE/TIME entity
+
+    Returns:
+        Parsed datetime, or None if the string is not a parseable date
+    """
+    return _parse_date_string_for_day(entity_text, date.today().toordinal())
+
+
+# Memoized NER results keyed by a digest of the email text. Re-scans of an
+# inbox mostly see bodies that have not changed, so a cache hit skips the
+# whole spaCy + dateparser pass for that email. Cached events embed resolved
+# datetimes and the future-date filter, both of which go stale at midnight
+# ("tomorrow" must re-resolve), so the cache is dropped on day rollover -
+# the same freshness rule _parse_date_string applies via its ordinal key.
+_EVENT_CACHE: Dict[bytes, List[Dict[str, Any]]] = {}
+_EVENT_CACHE_MAX_SIZE = 4096
+_EVENT_CACHE_DAY: Optional[int] = None
+
+
+def _text_digest(text: str) -> bytes:
+    """Compact cache key for an email text (full bodies are too large to keep)."""
+    return hashlib.blake2b(text.encode('utf-8', errors='replace'), digest_size=16).digest()
+
+
 def find_actionable_events(text: str) -> List[Dict[str, Any]]:
     """
     Analyze email text to identify actionable events like deadlines and meetings.
-    
+
     Uses spaCy for Named Entity Recognition to find dates in context,
     then dateparser to convert findings into proper datetime objects.
-    
+    Results are memoized per email text, so repeat scans over an unchanged
+    inbox skip the expensive NER work entirely.
+
     Args:
         text: Clean email body text to analyze
-        
+
     Returns:
         List of dictionaries containing actionable events with context and datetime objects
     """
+    # Skip the pipeline outright for empty or whitespace-only input; any
+    # non-blank text goes through - even short fragments like
+    # "Due tomorrow, 5pm" carry a date plus usable context
     if not text or not text.strip():
         return []
-    
+
+    # Strip quoted replies/signatures and bound the text size before NER
+    text = _condense_text(text)
+
+    # Skip the neural pipeline entirely when no date-like token is present
+    if not text.strip() or not _DATE_HINT.search(text):
+        return []
+
+    global _EVENT_CACHE_DAY
+    today_ordinal = date.today().toordinal()
+    if _EVENT_CACHE_DAY != today_ordinal:
+        _EVENT_CACHE.clear()
+        _EVENT_CACHE_DAY = today_ordinal
+
+    cache_key = _text_digest(text)
+    cached_events = _EVENT_CACHE.get(cache_key)
+    if cached_events is not None:
+        # Return copies so callers can annotate events without corrupting the cache
+        return [dict(event) for event in cached_events]
+
     try:
-        # Load the pre-trained spaCy model
-        nlp = spacy.load('en_core_web_sm')
-        
+        # Get the cached pre-trained spaCy model (loaded once per process)
+        nlp = _get_nlp()
+
         # Process the input text with spaCy
         doc = nlp(text)
-        
-        # Store potential events found by spaCy NER
-        potential_events = []
-        
-        # Iterate through named entities to find dates and times
-        for ent in doc.ents:
-            if ent.label_ in ['DATE', 'TIME']:
-                # Find context by getting the grammatical "head" of the entity's root token
-                # This often captures key verbs/nouns like "due", "meeting", "schedule"
-                context_word = ent.root.head.text
-                
-                # Get surrounding context for better understanding
-                # Look at tokens before and after the entity
-                start_idx = max(0, ent.start - 3)
-                end_idx = min(len(doc), ent.end + 3)
-                surrounding_context = doc[start_idx:end_idx].text
-                
-                potential_events.append({
-                    'entity_text': ent.text,
-                    'entity_label': ent.label_,
-                    'context_word': context_word,
-                    'surrounding_context': surrounding_context.strip(),
-                    'start_char': ent.start_char,
-                    'end_char': ent.end_char
-                })
-        
-        # Use dateparser to validate and parse the potential events
-        actionable_events = []
-        current_time = datetime.now()
-        
-        for event in potential_events:
-            try:
-                # Use dateparser with future preference setting
-                parsed_datetime = dateparser.parse(
-                    event['entity_text'],
-                    settings={'PREFER_DATES_FROM': 'future'}
-                )
-                
-                # Check if dateparser returned a valid datetime and it's in the future
-                if parsed_datetime and isinstance(parsed_datetime, datetime):
-                    # Handle timezone-aware vs timezone-naive comparison
-                    if parsed_datetime.tzinfo is not None:
-                        # parsed_datetime is timezone-aware, make current_time aware
-                        current_time_aware = current_time.replace(tzinfo=parsed_datetime.tzinfo)
-                        is_future = parsed_datetime > current_time_aware
-                    else:
-                        # Both are timezone-naive
-                        is_future = parsed_datetime > current_time
-                    
-                    if is_future:
-                        # Create event context from surrounding text and context word
-                        event_context = f"{event['context_word']} - {event['surrounding_context']}"
-                        
-                        actionable_events.append({
-                            'event_context': event_context.strip(),
-                            'datetime': parsed_datetime,
-                            'original_text': event['entity_text'],
-                            'entity_label': event['entity_label']
-                        })
-                    
-            except Exception as e:
-                # Suppress timezone warnings but log other errors
-                if "offset-naive and offset-aware" not in str(e):
-                    print(f"Warning: Could not parse date '{event['entity_text']}': {e}")
-                continue
-        
-        return actionable_events
-        
+
+        events = _extract_events_from_doc(doc)
+
+        # Bound the cache so a long-running process cannot grow it forever
+        if len(_EVENT_CACHE) >= _EVENT_CACHE_MAX_SIZE:
+            _EVENT_CACHE.clear()
+        _EVENT_CACHE[cache_key] = [dict(event) for event in events]
+
+        return events
+
     except OSError as e:
         print(f"Error: Could not load spaCy model. Please install it with: python -m spacy download en_core_web_sm")
         print(f"Error details: {e}")
@@ -116,6 +259,172 @@ def find_actionable_events(text: str) -> List[Dict[str, Any]]:
         return []
 
 
+# Multiprocess NER only pays off once the worker startup cost is amortized
+# over enough documents; below this count the serial pipeline wins
+_MIN_TEXTS_FOR_MULTIPROCESS = 16
+
+
+def find_actionable_events_batch(texts: List[str], batch_size: int = 32,
+                                 n_process: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Analyze many email texts in one pass using spaCy's batched pipeline.
+
+    nlp.pipe() processes documents in minibatches, which is substantially
+    faster than calling nlp(text) once per email because tok2vec and NER
+    operate on larger tensors. For large scans on multi-core machines the
+    work is additionally spread across worker processes.
+
+    Args:
+        texts: List of clean email body texts to analyze
+        batch_size: Number of documents per spaCy minibatch
+        n_process: Worker process count for nlp.pipe; defaults to half the
+            available cores for large batches and 1 for small ones
+
+    Returns:
+        One list of actionable events per input text, in the same order
+    """
+    if not texts:
+        return []
+
+    try:
+        nlp = _get_nlp()
+
+        # Entries that are blank or fail the date-hint prefilter still need a
+        # slot in the output; feed spaCy a space for them so document order
+        # is preserved without special-casing indices
+        condensed = [_condense_text(text) if text else '' for text in texts]
+        prepared = [
+            text if text.strip() and _DATE_HINT.search(text) else ' '
+            for text in condensed
+        ]
+
+        if n_process is None:
+            # REMINDER_NLP_PROCESSES pins the worker count - useful to
+            # force 1 on platforms where forking the pipeline misbehaves
+            # (Windows spawn, GPU-backed models)
+            env_override = os.environ.get('REMINDER_NLP_PROCESSES')
+            if env_override:
+                try:
+                    n_process = max(1, int(env_override))
+                except ValueError:
+                    print(f"Warning: ignoring invalid REMINDER_NLP_PROCESSES={env_override!r}")
+
+        if n_process is None:
+            if len(prepared) >= _MIN_TEXTS_FOR_MULTIPROCESS:
+                n_process = max(1, (os.cpu_count() or 1) // 2)
+            else:
+                n_process = 1
+
+        try:
+            docs = list(nlp.pipe(prepared, batch_size=batch_size, n_process=n_process))
+        except Exception as e:
+            # n_process > 1 requires the pipeline to pickle into workers;
+            # fall back to the serial pipeline if that fails
+            if n_process <= 1:
+                raise
+            print(f"Warning: Multiprocess NER failed ({e}), falling back to serial")
+            docs = list(nlp.pipe(prepared, batch_size=batch_size))
+
+        # One clock snapshot for the whole batch instead of one per document
+        current_time = datetime.now()
+        return [_extract_events_from_doc(doc, current_time) for doc in docs]
+
+    except OSError as e:
+        print(f"Error: Could not load spaCy model. Please install it with: python -m spacy download en_core_web_sm")
+        print(f"Error details: {e}")
+        return [[] for _ in texts]
+    except Exception as e:
+        print(f"Error analyzing texts for actionable events: {e}")
+        return [[] for _ in texts]
+
+
+def _extract_events_from_doc(doc, current_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Extract actionable events from an already-processed spaCy Doc.
+
+    Shared by find_actionable_events and find_actionable_events_batch so the
+    NER post-processing and date parsing live in one place.
+
+    Args:
+        doc: spaCy Doc object produced by the cached pipeline
+        current_time: Reference "now" for the is-it-in-the-future check;
+            batch callers pass one snapshot shared by the whole scan
+
+    Returns:
+        List of dictionaries containing actionable events
+    """
+    actionable_events = []
+    if current_time is None:
+        current_time = datetime.now()
+
+    # Compare entity labels as interned ints rather than strings: ent.label_
+    # re-materializes a Python string (and hashes it against the list) per
+    # entity, while ent.label is a plain integer already on the entity
+    strings = doc.vocab.strings
+    date_id = strings['DATE']
+    time_id = strings['TIME']
+    doc_len = len(doc)
+
+    # Single fused pass: each DATE/TIME entity is parsed and validated as it
+    # is found. The old two-pass shape allocated an intermediate dict per
+    # entity only to re-iterate it immediately, and context strings are now
+    # built only for entities that survive the future-date filter.
+    for ent in doc.ents:
+        if ent.label != date_id and ent.label != time_id:
+            continue
+
+        entity_text = ent.text
+        try:
+            # Use the cached English-only dateparser with future preference
+            parsed_datetime = _parse_date_string(entity_text)
+
+            # dateparser's contract is datetime-or-None, so a None check is
+            # all the validation this branch needs
+            if parsed_datetime is not None:
+                # Handle timezone-aware vs timezone-naive comparison
+                if parsed_datetime.tzinfo is not None:
+                    # parsed_datetime is timezone-aware, make current_time aware
+                    current_time_aware = current_time.replace(tzinfo=parsed_datetime.tzinfo)
+                    is_future = parsed_datetime > current_time_aware
+                else:
+                    # Both are timezone-naive
+                    is_future = parsed_datetime > current_time
+
+                if is_future:
+                    # Find context via the grammatical "head" of the entity's
+                    # root token - this often captures key verbs/nouns like
+                    # "due", "meeting", "schedule"
+                    context_word = ent.root.head.text
+
+                    # The entity's sentence gives the surrounding context;
+                    # the parser has already computed sentence boundaries,
+                    # so this reuses cached spans instead of assembling a
+                    # token-window string. Run-on sentences fall back to
+                    # the old +/-3 token window to keep contexts readable.
+                    sentence_text = ent.sent.text.strip()
+                    if len(sentence_text) <= 200:
+                        surrounding_context = sentence_text
+                    else:
+                        start_idx = max(0, ent.start - 3)
+                        end_idx = min(doc_len, ent.end + 3)
+                        surrounding_context = doc[start_idx:end_idx].text.strip()
+
+                    actionable_events.append({
+                        'event_context': f"{context_word} - {surrounding_context}".strip(),
+                        'datetime': parsed_datetime,
+                        'original_text': entity_text,
+                        'entity_label': ent.label_
+                    })
+
+        except Exception as e:
+            # Suppress timezone warnings but log other errors
+            if "offset-naive and offset-aware" not in str(e):
+                print(f"Warning: Could not parse date '{entity_text}': {e}")
+            continue
+
+    return actionable_events
+
+
 def analyze_email_content(parsed_email: Dict[str, str]) -> Dict[str, Any]:
     """
     Comprehensive analysis of parsed email content to extract actionable insights.
@@ -129,8 +438,11 @@ def analyze_email_content(parsed_email: Dict[str, str]) -> Dict[str, Any]:
     if not parsed_email or 'body' not in parsed_email:
         return {'actionable_events': [], 'analysis_summary': 'No email content to analyze'}
     
-    # Combine subject and body for comprehensive analysis
-    full_text = f"{parsed_email.get('subject', '')} {parsed_email.get('body', '')}"
+    # Combine subject and body for comprehensive analysis, skipping empty
+    # parts so a subject-less email does not force a copy of the whole body
+    # just to prepend a space
+    parts = [p for p in (parsed_email.get('subject', ''), parsed_email.get('body', '')) if p]
+    full_text = ' '.join(parts)
     
     # Find actionable events in the combined text
     events = find_actionable_events(full_text)
@@ -11,6 +11,9 @@ For production deployment, consider using system schedulers like cron
 for better reliability and resource management.
 """
 
+import concurrent.futures
+import functools
+import logging
 import schedule
 import time
 from datetime import datetime
@@ -20,15 +23,52 @@ import os
 # Import functions from our custom modules
 try:
     from auth import get_gmail_service
-    from email_fetcher import search_emails, get_raw_email
+    from email_fetcher import search_emails, get_metadata_batch, get_raw_emails_batch
     from email_parser import parse_raw_email
-    from intelligence_module import find_actionable_events
-    from notifier import send_desktop_notification, format_event_notification, send_email_reminder
+    from intelligence_module import find_actionable_events_batch, has_date_hint
+    from notifier import send_desktop_notification, format_event_notification, SmtpPool
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("💡 Ensure all module files are in the same directory")
     sys.exit(1)
 
+# Workflow observability goes through logging rather than print: per-email
+# chatter sits at DEBUG so the default INFO run emits a handful of phase
+# lines instead of ~10 stdout writes (each one a lock acquire and, under
+# cron redirection, a synchronous flush) per email.
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_service():
+    """
+    Build the Gmail service once and reuse it across scheduled runs.
+
+    In continuous mode the workflow fires every 15 minutes; rebuilding the
+    client each time re-reads token.json and re-fetches the discovery
+    document for nothing - the credentials object refreshes its own access
+    token as needed. Callers clear the cache on failure so the next run
+    re-authenticates from scratch.
+    """
+    return get_gmail_service()
+
+
+def _send_email_reminders(email_tasks):
+    """
+    Send queued email reminders concurrently over pooled SMTP connections.
+
+    Worker threads check authenticated connections out of an SmtpPool, so a
+    batch pays the TCP+TLS+AUTH handshake once per pooled connection instead
+    of once per message, while the sends themselves overlap. The pool size
+    also caps concurrency so a large batch cannot trip SMTP rate limits.
+    """
+    pool = SmtpPool()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=pool.maxsize) as executor:
+            list(executor.map(lambda task: pool.send(*task), email_tasks))
+    finally:
+        pool.close()
+
 
 def run_reminder_workflow():
     """
@@ -41,86 +81,136 @@ def run_reminder_workflow():
     4. Extract actionable events using NLP
     5. Send notifications for upcoming events
     """
-    print("\n" + "="*60)
-    print(f"🚀 Starting Email Reminder Workflow - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("="*60)
+    # One timestamp for the whole run - reused by every notification body so
+    # all events from one workflow report the same detection time
+    workflow_start = datetime.now()
+    workflow_start_str = workflow_start.strftime('%Y-%m-%d %H:%M:%S')
+
+    logger.info("🚀 Starting Email Reminder Workflow - %s", workflow_start_str)
     
     # Step 1: Authentication
-    print("🔐 Step 1: Authenticating with Gmail...")
-    service = get_gmail_service()
-    
+    logger.debug("🔐 Step 1: Authenticating with Gmail...")
+    service = _get_service()
+
     if not service:
-        print("❌ Authentication failed. Cannot proceed with workflow.")
+        logger.error("❌ Authentication failed. Cannot proceed with workflow.")
+        # Drop the cached (failed) service so the next run retries the
+        # full auth flow instead of replaying this failure
+        _get_service.cache_clear()
         return
     
-    print("✅ Successfully authenticated with Gmail")
+    logger.debug("✅ Successfully authenticated with Gmail")
     
     # Step 2: Search for emails
-    print("\n📧 Step 2: Searching for recent unread emails...")
+    logger.debug("📧 Step 2: Searching for recent unread emails...")
     
-    # Search for unread emails from the last day
-    query = "is:unread newer_than:1d"
+    # Search for unread emails from the last day, excluding promotional and
+    # social mail server-side so it never reaches the fetch/NLP stages
+    query = "is:unread newer_than:1d -category:promotions -category:social"
     messages = search_emails(service, query)
     
     if not messages:
-        print("📭 No new unread emails found.")
+        logger.info("📭 No new unread emails found.")
         return
     
-    print(f"📬 Found {len(messages)} unread email(s) to process")
+    logger.info("📬 Found %d unread email(s) to process", len(messages))
     
-    # Step 3: Process each email
+    # Triage with cheap metadata first: a metadata response is a few hundred
+    # bytes versus full raw MIME, and messages whose subject and snippet show
+    # no date-like token cannot produce an actionable event
+    metadata = get_metadata_batch(service, [m['id'] for m in messages])
+    triaged_ids = []
+    for message in messages:
+        meta = metadata.get(message['id'])
+        # A failed metadata fetch is no verdict on the message - keep it in
+        # the fetch set rather than silently dropping it for the run
+        if meta is None or has_date_hint(
+                f"{meta['headers'].get('Subject', '')} {meta['snippet']}"):
+            triaged_ids.append(message['id'])
+
+    skipped = len(messages) - len(triaged_ids)
+    if skipped:
+        logger.info("⏭️  Skipping %d email(s) with no date-like content", skipped)
+
+    if not triaged_ids:
+        logger.info("📭 No emails with date-like content to process.")
+        return
+
+    # Fetch raw contents only for the survivors, in batched requests (one
+    # HTTP round trip per 100 messages instead of one per message)
+    raw_emails = get_raw_emails_batch(service, triaged_ids)
+    messages = [m for m in messages if m['id'] in raw_emails]
+
+    # Step 3: Parse each email, collecting texts for one batched NLP pass
     total_events_found = 0
     processed_emails = 0
-    
+    parsed_emails = []
+
     for i, message in enumerate(messages, 1):
         message_id = message['id']
-        print(f"\n🔍 Step 3.{i}: Processing email ID: {message_id}")
-        
-        # Fetch raw email content
-        raw_email_bytes = get_raw_email(service, message_id)
-        
+        logger.debug("🔍 Step 3.%d: Processing email ID: %s", i, message_id)
+
+        # Look up the batch-fetched raw email content
+        raw_email_bytes = raw_emails.get(message_id)
+
         if not raw_email_bytes:
-            print(f"❌ Failed to fetch content for email {message_id}")
+            logger.warning("❌ Failed to fetch content for email %s", message_id)
             continue
-        
+
         # Parse email content
         parsed_email = parse_raw_email(raw_email_bytes)
         
         if not parsed_email or not parsed_email.get('body'):
-            print(f"❌ Failed to parse email {message_id} or no body content")
+            logger.warning("❌ Failed to parse email %s or no body content", message_id)
             continue
         
-        print(f"✅ Parsed email from: {parsed_email.get('from', 'Unknown')}")
-        print(f"   Subject: {parsed_email.get('subject', 'No subject')[:50]}...")
-        
-        # Extract actionable events using NLP
-        print("🧠 Analyzing email content for actionable events...")
-        
-        # Combine subject and body for comprehensive analysis
-        full_text = f"{parsed_email.get('subject', '')} {parsed_email.get('body', '')}"
-        actionable_events = find_actionable_events(full_text)
-        
+        logger.debug("✅ Parsed email from: %s, subject: %s...",
+                     parsed_email.get('from', 'Unknown'),
+                     parsed_email.get('subject', 'No subject')[:50])
+
+        parsed_emails.append(parsed_email)
+        processed_emails += 1
+
+    # Extract actionable events using NLP in one batched pipeline pass
+    # (nlp.pipe analyzes all emails together instead of one at a time)
+    logger.info("🧠 Analyzing email content for actionable events...")
+
+    # Combine subject and body for comprehensive analysis
+    full_texts = [
+        f"{parsed_email.get('subject', '')} {parsed_email.get('body', '')}"
+        for parsed_email in parsed_emails
+    ]
+    all_actionable_events = find_actionable_events_batch(full_texts)
+
+    # Email reminders are queued during the loop and dispatched concurrently
+    # at the end - desktop notifications stay serial since OS toast APIs are
+    # not reliably thread-safe
+    email_tasks = []
+
+    for i, (parsed_email, actionable_events) in enumerate(
+            zip(parsed_emails, all_actionable_events), 1):
         if actionable_events:
-            print(f"✅ Found {len(actionable_events)} actionable event(s)")
+            logger.debug("✅ Found %d actionable event(s)", len(actionable_events))
             total_events_found += len(actionable_events)
             
             # Step 4: Send notifications for each event
             for j, event in enumerate(actionable_events, 1):
-                print(f"\n🔔 Step 4.{i}.{j}: Sending notification for event...")
+                logger.debug("🔔 Step 4.%d.%d: Sending notification for event...", i, j)
                 
                 # Format notification content
                 title, message = format_event_notification(
-                    event, 
-                    parsed_email.get('subject', '')
+                    event,
+                    parsed_email.get('subject', ''),
+                    now=workflow_start
                 )
                 
                 # Send desktop notification
                 success = send_desktop_notification(title, message)
 
                 if success:
-                    print(f"✅ Notification sent for: {event.get('original_text', 'Unknown event')}")
+                    logger.debug("✅ Notification sent for: %s", event.get('original_text', 'Unknown event'))
                 else:
-                    print(f"❌ Failed to send notification for: {event.get('original_text', 'Unknown event')}")
+                    logger.warning("❌ Failed to send notification for: %s", event.get('original_text', 'Unknown event'))
                     # Fallback: Show console notification
                     print("\n" + "="*60)
                     print("🔔 CONSOLE NOTIFICATION (Desktop notification failed)")
@@ -140,27 +230,28 @@ def run_reminder_workflow():
 
 📧 Original Email Subject: {parsed_email.get('subject', 'N/A')}
 👤 From: {parsed_email.get('from', 'N/A')}
-🕒 Detected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+🕒 Detected: {workflow_start_str}
 
 ---
 This reminder was automatically generated by the Smart Email Reminder System.
 """
-                    send_email_reminder(recipient_email, f"📅 {title}", email_body)
+                    email_tasks.append((recipient_email, f"📅 {title}", email_body))
                 else:
-                    print("⚠️  No SENDER_EMAIL configured - skipping email reminder")
+                    logger.warning("⚠️  No SENDER_EMAIL configured - skipping email reminder")
         else:
-            print("📝 No actionable events found in this email")
-        
-        processed_emails += 1
-    
+            logger.debug("📝 No actionable events found in this email")
+
+    # Step 5: Dispatch all queued email reminders concurrently
+    if email_tasks:
+        logger.info("📨 Sending %d email reminder(s)...", len(email_tasks))
+        try:
+            _send_email_reminders(email_tasks)
+        except Exception as e:
+            logger.error("❌ Email reminder dispatch failed: %s", e)
+
     # Workflow summary
-    print("\n" + "="*60)
-    print("📊 WORKFLOW SUMMARY")
-    print("="*60)
-    print(f"📧 Emails processed: {processed_emails}")
-    print(f"🎯 Total actionable events found: {total_events_found}")
-    print(f"⏰ Workflow completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("="*60)
+    logger.info("📊 Workflow summary: %d email(s) processed, %d actionable event(s) found",
+                processed_emails, total_events_found)
 
 
 def run_once_and_exit():
@@ -186,6 +277,12 @@ if __name__ == '__main__':
     2. Single execution (--once flag) - runs once and exits (for cron)
     """
     
+    logging.basicConfig(
+        level=logging.DEBUG if os.getenv("REMINDER_DEBUG") else logging.INFO,
+        format="%(asctime)s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
     print("🎯 Smart Email Reminder System Starting...")
     print("=" * 60)
     
@@ -8,15 +8,125 @@ Required packages:
 pip install plyer python-dotenv
 """
 
-from plyer import notification
-import smtplib
+import functools
 import os
 import platform
-from email.message import EmailMessage
-from dotenv import load_dotenv
+import string
+import sys
+import queue
+import threading
+from datetime import datetime
 
-# Load environment variables from .env file
-load_dotenv()
+# smtplib (which drags in ssl, socket and hmac) and the email.message
+# machinery are imported inside the send path: the desktop-notification-only
+# entrypoints import this module without ever touching SMTP
+
+# Notification formatting constants - shared by every event in a batch
+_EVENT_DATE_FMT = '%A, %B %d at %I:%M %p'
+_URGENCY_TABLE = {0: "TODAY", 1: "TOMORROW"}
+
+# XML entity escaping for the Windows toast template, as one C-level pass
+# (str.translate) instead of chained .replace() scans. Newlines become a
+# separator since toast text elements are single-line.
+_TOAST_XML_TABLE = str.maketrans({
+    '\n': ' | ',
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;',
+})
+
+# plyer is imported lazily: it probes platform notification backends at
+# import time, which every importer of this module (main pipeline, tests)
+# would otherwise pay even when only the email path is used
+_notification = None
+
+
+def _get_notification():
+    """Import and cache plyer's notification facade on first use."""
+    global _notification
+    if _notification is None:
+        from plyer import notification as _plyer_notification
+        _notification = _plyer_notification
+    return _notification
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """
+    Load .env on first credential lookup instead of at import time.
+
+    Reading and parsing the .env file is pure overhead for importers that
+    never send email; lru_cache makes repeat calls free.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+# PowerShell toast script, compiled once - only $title/$msg vary per call,
+# so substitution touches two small strings instead of rebuilding the whole
+# ~1KB script. PowerShell's own variables are escaped as $$.
+_PS_TOAST_TEMPLATE = string.Template('''
+try {
+    [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+    [Windows.UI.Notifications.ToastNotification, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+    [Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+
+    $$template = @"
+<toast>
+    <visual>
+        <binding template="ToastGeneric">
+            <text>$title</text>
+            <text>$msg</text>
+        </binding>
+    </visual>
+</toast>
+"@
+
+    $$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
+    $$xml.LoadXml($$template)
+    $$toast = New-Object Windows.UI.Notifications.ToastNotification $$xml
+    [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("Smart Email Reminder").Show($$toast)
+    Write-Host "Toast notification sent successfully"
+} catch {
+    Write-Error $$_.Exception.Message
+    exit 1
+}
+''')
+
+# The platform never changes mid-process, and platform.system() can shell
+# out to uname on some Unix builds - resolve it once at import
+_IS_WINDOWS = platform.system().lower() == "windows"
+
+# Troubleshooting tips shown with the console fallback - built once so the
+# block is a single interned constant rather than five literals per call
+_NOTIFICATION_TIPS = "\n".join((
+    "💡 If you don't see desktop notifications:",
+    "   1. Check Windows Settings > System > Notifications & actions",
+    "   2. Make sure notifications are enabled",
+    "   3. Check if Focus Assist is turned off",
+    "   4. Try running as administrator",
+))
+
+# Full console-fallback block as one template so the slow path issues a
+# single stdout write instead of a dozen print calls (each print acquires
+# the stdout lock and writes separately)
+_CONSOLE_TEMPLATE = (
+    "\n" + "=" * 70 + "\n"
+    "🔔 REMINDER NOTIFICATION\n"
+    + "=" * 70 + "\n"
+    "📅 {title}\n"
+    "📝 {message}\n"
+    + "=" * 70 + "\n"
+    + _NOTIFICATION_TIPS + "\n"
+    + "=" * 70 + "\n"
+)
+
+# Outcome of the PowerShell toast fallback, cached per process: None until
+# first attempted, then True/False. Without this a broken fallback (missing
+# WinRT types, hung host) re-pays its full timeout for every event in a batch.
+_toast_fallback_ok = None
 
 
 def send_desktop_notification(title: str, message: str) -> bool:
@@ -30,12 +140,16 @@ def send_desktop_notification(title: str, message: str) -> bool:
     Returns:
         bool: True if notification was sent successfully, False otherwise
     """
-    # Clean the message for XML compatibility
-    clean_message = message.replace('\n', ' | ').replace('"', "'").replace('&', '&amp;')
+    global _toast_fallback_ok
+
+    # Escape title and message for the toast XML template. The old replace()
+    # chain missed < and > and double-escaped any pre-existing entities.
+    clean_title = title.translate(_TOAST_XML_TABLE)
+    clean_message = message.translate(_TOAST_XML_TABLE)
 
     try:
         # Try plyer first (most reliable cross-platform)
-        notification.notify(  # type: ignore
+        _get_notification().notify(  # type: ignore
             title=title,
             message=message,
             timeout=30,
@@ -47,155 +161,341 @@ def send_desktop_notification(title: str, message: str) -> bool:
     except Exception as e:
         print(f"❌ Plyer notification failed: {e}")
 
-        # Try Windows-specific toast notification
-        if platform.system().lower() == "windows":
+        # Try Windows-specific toast notification - but only once it has not
+        # already failed this process; a batch of events should not pay the
+        # subprocess timeout repeatedly for a fallback that cannot work
+        if _IS_WINDOWS and _toast_fallback_ok is not False:
             try:
                 import subprocess
 
-                # Create a more robust PowerShell command for Windows 11
-                ps_command = f'''
-                try {{
-                    [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-                    [Windows.UI.Notifications.ToastNotification, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-                    [Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+                # Fill in the precompiled toast script (robust on Windows 11)
+                ps_command = _PS_TOAST_TEMPLATE.substitute(
+                    title=clean_title, msg=clean_message)
 
-                    $template = @"
-<toast>
-    <visual>
-        <binding template="ToastGeneric">
-            <text><![CDATA[{title}]]></text>
-            <text><![CDATA[{clean_message}]]></text>
-        </binding>
-    </visual>
-</toast>
-"@
-
-                    $xml = New-Object Windows.Data.Xml.Dom.XmlDocument
-                    $xml.LoadXml($template)
-                    $toast = New-Object Windows.UI.Notifications.ToastNotification $xml
-                    [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("Smart Email Reminder").Show($toast)
-                    Write-Host "Toast notification sent successfully"
-                }} catch {{
-                    Write-Error $_.Exception.Message
-                    exit 1
-                }}
-                '''
-
-                result = subprocess.run(["powershell", "-Command", ps_command],
-                                      capture_output=True, text=True, timeout=15)
+                # -NoProfile skips the user's profile scripts (often the bulk
+                # of PowerShell's cold-start time); the other flags keep the
+                # one-shot host from prompting or tripping script policy
+                result = subprocess.run(["powershell", "-NoProfile", "-NonInteractive",
+                                       "-ExecutionPolicy", "Bypass", "-Command", ps_command],
+                                      capture_output=True, text=True, timeout=5)
 
                 if result.returncode == 0:
+                    _toast_fallback_ok = True
                     print(f"✅ Windows toast notification sent: {title}")
                     return True
                 else:
+                    _toast_fallback_ok = False
                     print(f"❌ Windows toast notification failed: {result.stderr}")
 
             except Exception as ps_e:
+                _toast_fallback_ok = False
                 print(f"❌ Windows toast notification also failed: {ps_e}")
 
     # Last resort: Console notification with enhanced visibility
-    print("\n" + "="*70)
-    print("🔔 REMINDER NOTIFICATION")
-    print("="*70)
-    print(f"📅 {title}")
-    print(f"📝 {message}")
-    print("="*70)
-    print("💡 If you don't see desktop notifications:")
-    print("   1. Check Windows Settings > System > Notifications & actions")
-    print("   2. Make sure notifications are enabled")
-    print("   3. Check if Focus Assist is turned off")
-    print("   4. Try running as administrator")
-    print("="*70)
+    sys.stdout.write(_CONSOLE_TEMPLATE.format(title=title, message=message))
 
     return True  # Console notification always "succeeds"
 
-    # Last resort: Console notification with enhanced visibility
-    print("\n" + "="*70)
-    print("🔔 REMINDER NOTIFICATION")
-    print("="*70)
-    print(f"📅 {title}")
-    print(f"📝 {message}")
-    print("="*70)
-    print("💡 If you don't see desktop notifications:")
-    print("   1. Check Windows Settings > System > Notifications & actions")
-    print("   2. Make sure notifications are enabled")
-    print("   3. Check if Focus Assist is turned off")
-    print("   4. Try running as administrator")
-    print("="*70)
 
-    return True  # Console notification always "succeeds"
+# Background notification worker: started lazily on the first async send so
+# importers that only use the synchronous API never spawn a thread
+_notify_q = None
+_notify_worker = None
+_notify_pending = set()
+_notify_lock = threading.Lock()
+
+
+def _notify_loop():
+    """Drain the notification queue, dispatching each entry synchronously."""
+    while True:
+        title, message = _notify_q.get()
+        try:
+            send_desktop_notification(title, message)
+        except Exception as e:
+            print(f"❌ Background notification failed: {e}")
+        finally:
+            with _notify_lock:
+                _notify_pending.discard((title, message))
+            _notify_q.task_done()
+
+
+def send_desktop_notification_async(title: str, message: str) -> bool:
+    """
+    Queue a desktop notification and return immediately.
+
+    Dispatch runs on a single daemon worker thread, so a slow toast backend
+    (plyer can block, and the PowerShell fallback waits up to 5s) never
+    stalls the calling pipeline. An identical notification already waiting
+    in the queue is dropped rather than shown twice.
+
+    Args:
+        title: Notification title
+        message: Notification message content
+
+    Returns:
+        bool: True - the notification was queued (or deduplicated)
+    """
+    global _notify_q, _notify_worker
+
+    key = (title, message)
+    with _notify_lock:
+        if _notify_q is None:
+            _notify_q = queue.Queue()
+            _notify_worker = threading.Thread(target=_notify_loop, daemon=True)
+            _notify_worker.start()
+
+        if key in _notify_pending:
+            return True
+        _notify_pending.add(key)
+
+    _notify_q.put(key)
+    return True
+
+
+class SmtpReminderSession:
+    """
+    Reusable SMTP session for sending batches of email reminders.
+
+    Opening a Gmail SMTP connection costs a TCP handshake, STARTTLS
+    negotiation and an AUTH exchange - far more than sending one message.
+    This session opens the connection once (lazily, on first send), logs in
+    once, and reuses it for every subsequent send, so N reminders cost one
+    handshake instead of N.
+
+    Usage:
+        with SmtpReminderSession() as smtp:
+            for recipient, subject, body in reminders:
+                smtp.send(recipient, subject, body)
+
+    Note: Requires a Gmail App Password (16-digit password) for
+    authentication - see send_email_reminder for the environment variables.
+    A session is not thread-safe; give each thread its own.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._sender = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _connect(self) -> bool:
+        """Open and authenticate the SMTP connection. Returns False on failure."""
+        import smtplib
+
+        # Get credentials from environment variables
+        _load_env()
+        sender_email = os.getenv("SENDER_EMAIL")
+        sender_app_password = os.getenv("SENDER_APP_PASSWORD")  # 16-digit App Password required
+
+        if not sender_email or not sender_app_password:
+            print("❌ Missing email credentials in environment variables")
+            print("💡 Please set SENDER_EMAIL and SENDER_APP_PASSWORD in your .env file")
+            print("💡 SENDER_APP_PASSWORD must be a 16-digit Gmail App Password, not your regular password")
+            return False
+
+        try:
+            # Implicit TLS on 465 sets up encryption in the initial handshake,
+            # skipping the extra EHLO/STARTTLS/EHLO round-trips port 587
+            # needs. The explicit timeout makes a dead server fail fast
+            # instead of hanging the caller.
+            server = smtplib.SMTP_SSL("smtp.gmail.com", 465, timeout=10)
+
+            # Login with App Password
+            server.login(sender_email, sender_app_password)
+
+        except smtplib.SMTPAuthenticationError as e:
+            print(f"❌ Email authentication failed: {e}")
+            print("💡 Ensure you're using a valid Gmail App Password, not your regular password")
+            print("💡 Enable 2FA and generate an App Password at: https://myaccount.google.com/apppasswords")
+            return False
+
+        except Exception as e:
+            print(f"❌ Failed to connect to SMTP server: {e}")
+            return False
+
+        self._server = server
+        self._sender = sender_email
+        return True
+
+    def _ensure_alive(self) -> bool:
+        """Verify the connection is still usable, reconnecting if it dropped."""
+        if self._server is not None:
+            try:
+                # NOOP is a cheap round-trip that surfaces dropped connections
+                # (Gmail closes idle sessions after a few minutes)
+                self._server.noop()
+                return True
+            except Exception:
+                self.close()
+
+        return self._connect()
+
+    def send(self, recipient_email: str, subject: str, body: str) -> bool:
+        """
+        Send one reminder over the shared connection.
+
+        Args:
+            recipient_email: Email address to send reminder to
+            subject: Email subject line
+            body: Email message body
+
+        Returns:
+            bool: True if email was sent successfully, False otherwise
+        """
+        if not self._ensure_alive():
+            return False
+
+        from email.message import EmailMessage
+        from email.utils import formatdate, make_msgid
+
+        try:
+            # Construct the email message
+            msg = EmailMessage()
+            msg['From'] = self._sender
+            msg['To'] = recipient_email
+            msg['Subject'] = subject
+            # Date and Message-ID are expected by strict receivers; setting
+            # them at compose time avoids making the server fill them in
+            msg['Date'] = formatdate(localtime=True)
+            msg['Message-ID'] = make_msgid(domain="smart-email-reminder")
+            msg.set_content(body)
+
+            self._server.send_message(msg)
+
+            print(f"✅ Email reminder sent to {recipient_email}: {subject}")
+            return True
+
+        except Exception as e:
+            print(f"❌ Failed to send email reminder: {e}")
+            # Drop the connection so the next send starts clean
+            self.close()
+            return False
+
+    def close(self):
+        """Close the SMTP connection if one is open."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+
+class SmtpPool:
+    """
+    Pool of SMTP sessions for concurrent reminder dispatch.
+
+    A single SmtpReminderSession serializes sends, and Gmail limits how many
+    messages one connection may carry. The pool hands out up to maxsize
+    independent sessions to worker threads (created lazily, so a one-off send
+    never opens more than one connection) and recycles a connection after
+    max_messages sends so long batches never hit the per-connection cap.
+
+    Usage:
+        pool = SmtpPool(maxsize=3)
+        with ThreadPoolExecutor(max_workers=pool.maxsize) as executor:
+            executor.map(lambda r: pool.send(*r), reminders)
+        pool.close()
+    """
+
+    def __init__(self, maxsize: int = 3, max_messages: int = 100):
+        self.maxsize = maxsize
+        self.max_messages = max_messages
+        self._q = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Check out a (session, sent_count) pair, creating one if under maxsize."""
+        with self._lock:
+            if self._created < self.maxsize:
+                self._created += 1
+                return SmtpReminderSession(), 0
+        # Pool is at capacity - wait for a worker to return a session
+        return self._q.get()
+
+    def release(self, session, sent_count):
+        """Return a session to the pool, recycling it once worn out."""
+        if sent_count >= self.max_messages:
+            # This connection has carried its quota - close it and hand back
+            # a fresh session that will reconnect on its next send
+            session.close()
+            self._q.put((SmtpReminderSession(), 0))
+        else:
+            self._q.put((session, sent_count))
+
+    def send(self, recipient_email: str, subject: str, body: str) -> bool:
+        """
+        Send one reminder using a pooled connection.
+
+        Safe to call from multiple threads; blocks if all connections are busy.
+
+        Returns:
+            bool: True if email was sent successfully, False otherwise
+        """
+        session, sent_count = self.acquire()
+        try:
+            return session.send(recipient_email, subject, body)
+        finally:
+            self.release(session, sent_count + 1)
+
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                session, _ = self._q.get_nowait()
+            except queue.Empty:
+                break
+            session.close()
+
+
+def send_email_reminder_pool(pool: SmtpPool, recipient_email: str, subject: str, body: str) -> bool:
+    """Send a reminder through an SmtpPool. Thin alias for pool.send()."""
+    return pool.send(recipient_email, subject, body)
 
 
 def send_email_reminder(recipient_email: str, subject: str, body: str) -> bool:
     """
     Send a reminder via email using Gmail's SMTP server.
-    
+
     Note: Requires a Gmail App Password (16-digit password) for authentication.
     Regular Gmail passwords will not work due to 2FA requirements.
-    
+
     Environment variables required:
     - SENDER_EMAIL: Gmail address to send from
     - SENDER_APP_PASSWORD: 16-digit Gmail App Password
-    
+
+    Callers with several reminders to send should use SmtpReminderSession
+    directly to amortize the connection handshake; this one-shot helper
+    opens and closes a session per message.
+
     Args:
         recipient_email: Email address to send reminder to
         subject: Email subject line
         body: Email message body
-        
+
     Returns:
         bool: True if email was sent successfully, False otherwise
     """
-    # Get credentials from environment variables
-    sender_email = os.getenv("SENDER_EMAIL")
-    sender_app_password = os.getenv("SENDER_APP_PASSWORD")  # 16-digit App Password required
-    
-    if not sender_email or not sender_app_password:
-        print("❌ Missing email credentials in environment variables")
-        print("💡 Please set SENDER_EMAIL and SENDER_APP_PASSWORD in your .env file")
-        print("💡 SENDER_APP_PASSWORD must be a 16-digit Gmail App Password, not your regular password")
-        return False
-    
-    try:
-        # Construct the email message
-        msg = EmailMessage()
-        msg['From'] = sender_email
-        msg['To'] = recipient_email
-        msg['Subject'] = subject
-        msg.set_content(body)
-        
-        # Send the email using Gmail's SMTP server
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            # Secure the connection
-            server.starttls()
-            
-            # Login with App Password
-            server.login(sender_email, sender_app_password)
-            
-            # Send the message
-            server.send_message(msg)
-            
-        print(f"✅ Email reminder sent to {recipient_email}: {subject}")
-        return True
-        
-    except smtplib.SMTPAuthenticationError as e:
-        print(f"❌ Email authentication failed: {e}")
-        print("💡 Ensure you're using a valid Gmail App Password, not your regular password")
-        print("💡 Enable 2FA and generate an App Password at: https://myaccount.google.com/apppasswords")
-        return False
-        
-    except Exception as e:
-        print(f"❌ Failed to send email reminder: {e}")
-        return False
+    with SmtpReminderSession() as session:
+        return session.send(recipient_email, subject, body)
 
 
-def format_event_notification(event: dict, email_subject: str = "") -> tuple:
+def format_event_notification(event: dict, email_subject: str = "", *, now=None) -> tuple:
     """
     Format an actionable event into notification title and message.
-    
+
     Args:
         event: Event dictionary from intelligence_module
         email_subject: Optional email subject for context
-        
+        now: Optional reference time; batch callers pass one timestamp for
+            the whole run instead of paying a datetime.now() per event
+
     Returns:
         tuple: (title, message) for notification
     """
@@ -203,34 +503,17 @@ def format_event_notification(event: dict, email_subject: str = "") -> tuple:
     event_context = event.get('event_context', 'Unknown event')
     event_datetime = event.get('datetime')
     original_text = event.get('original_text', '')
-    
+
     # Format the datetime
     if event_datetime:
-        formatted_date = event_datetime.strftime('%A, %B %d at %I:%M %p')
-        
-        # Calculate urgency - handle timezone-aware vs timezone-naive comparison
-        from datetime import datetime
-        current_time = datetime.now()
-        
-        if event_datetime.tzinfo is not None:
-            # event_datetime is timezone-aware, make current_time aware
-            current_time = current_time.replace(tzinfo=event_datetime.tzinfo)
-        
-        try:
-            days_until = (event_datetime - current_time).days
-            
-            if days_until == 0:
-                urgency = "TODAY"
-            elif days_until == 1:
-                urgency = "TOMORROW"
-            elif days_until <= 3:
-                urgency = f"IN {days_until} DAYS"
-            else:
-                urgency = f"IN {days_until} DAYS"
-        except Exception as e:
-            # Fallback if date calculation fails
-            urgency = "UPCOMING"
-            days_until = 0
+        formatted_date = event_datetime.strftime(_EVENT_DATE_FMT)
+
+        # Calculate urgency on calendar dates: date objects carry no tzinfo,
+        # so aware and naive event datetimes subtract the same way and the
+        # old tz-normalization step and its defensive try/except go away
+        current_time = now if now is not None else datetime.now()
+        days_until = (event_datetime.date() - current_time.date()).days
+        urgency = _URGENCY_TABLE.get(days_until) or f"IN {days_until} DAYS"
     else:
         formatted_date = "Unknown date"
         urgency = ""
@@ -238,17 +521,15 @@ def format_event_notification(event: dict, email_subject: str = "") -> tuple:
     # Create notification title
     title = f"📅 Reminder: {urgency}"
     
-    # Create notification message
-    message_parts = []
-    if email_subject:
-        message_parts.append(f"From email: {email_subject}")
-    message_parts.append(f"Event: {event_context}")
-    message_parts.append(f"When: {formatted_date}")
-    if original_text:
-        message_parts.append(f"Original: \"{original_text}\"")
-    
-    message = "\n".join(message_parts)
-    
+    # Create notification message in one concatenation - the structure is
+    # fixed at four lines, so no need for a parts list and join
+    message = (
+        (f"From email: {email_subject}\n" if email_subject else "")
+        + f"Event: {event_context}\n"
+        f"When: {formatted_date}"
+        + (f"\nOriginal: \"{original_text}\"" if original_text else "")
+    )
+
     return title, message
 
 
@@ -290,6 +571,7 @@ if __name__ == '__main__':
     
     # Test email reminder (will only work if .env is configured)
     print("\n📧 Testing email reminder...")
+    _load_env()
     test_recipient = os.getenv("TEST_EMAIL", "test@example.com")
     
     if os.getenv("SENDER_EMAIL") and os.getenv("SENDER_APP_PASSWORD"):
@@ -7,8 +7,7 @@ This script tests the email reminder functionality to ensure it works properly.
 
 import os
 import sys
-from dotenv import load_dotenv
-from notifier import send_email_reminder
+from notifier import send_email_reminder, _load_env
 
 def test_email_reminder():
     """Test the email reminder functionality."""
@@ -16,8 +15,10 @@ def test_email_reminder():
     print("📧 Smart Email Reminder - Email Test")
     print("=" * 50)
 
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables through notifier's cached loader so the
+    # .env file is parsed at most once per process, shared with the
+    # send path itself
+    _load_env()
 
     # Check if required environment variables are set
     sender_email = os.getenv("SENDER_EMAIL")